@@ -2,14 +2,26 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 import fnmatch
+from functools import lru_cache, wraps
+import glob
 import hashlib
+from io import BufferedReader, BufferedWriter, BytesIO
+import math
+import mmap
+import operator
 import os
 from pathlib import Path
 import posixpath
+import re
 import tarfile
-from typing import Any, Callable, ClassVar, TypedDict
+import tempfile
+import threading
+import time
+from typing import IO, Any, Callable, ClassVar, Iterator, TypedDict, TypeVar, cast
 import uuid
 
 from aiida.cmdline.params.options.interactive import InteractiveOption
@@ -19,8 +31,10 @@ from aiida.transports.util import FileAttribute
 from click.core import Context
 from click.types import ParamType
 from firecrest import ClientCredentialsAuth, Firecrest  # type: ignore[attr-defined]
-from firecrest.path import FcPath
-from packaging.version import Version, parse
+from firecrest.path import FcPath, _Cache, _ls_to_st_mode
+from packaging.version import InvalidVersion, Version, parse
+
+from .utils import convert_header_exceptions, disable_fc_logging
 
 
 class ValidAuthOption(TypedDict, total=False):
@@ -36,6 +50,319 @@ class ValidAuthOption(TypedDict, total=False):
     callback: Callable[..., Any]  # for validation
 
 
+_MIN_TRANSFER_CHUNK_BYTES = 64 * 1024
+"""The smallest buffer size that can be set with the `AIIDA_FIRECREST_CHUNK_MB` environment variable."""
+
+
+def _transfer_chunk_bytes(default_mb: float = 1) -> int:
+    """Return the buffer size set (in MB) by the `AIIDA_FIRECREST_CHUNK_MB` environment variable.
+
+    Values that are not finite numbers fall back to the default, and sizes are at least `_MIN_TRANSFER_CHUNK_BYTES`.
+    """
+    try:
+        size_mb = float(os.environ.get("AIIDA_FIRECREST_CHUNK_MB", default_mb))
+    except ValueError:
+        size_mb = default_mb
+    if not math.isfinite(size_mb):
+        size_mb = default_mb
+    return max(int(size_mb * 1024 * 1024), _MIN_TRANSFER_CHUNK_BYTES)
+
+
+_TRANSFER_CHUNK_BYTES = _transfer_chunk_bytes()
+"""Buffer size for local reads and writes of transferred files (hashing, tar archives).
+Can be tuned with the `AIIDA_FIRECREST_CHUNK_MB` environment variable."""
+
+_TAR_EXTRACT_KWARGS: dict[str, Any] = (
+    {"filter": "tar"} if hasattr(tarfile, "tar_filter") else {}
+)
+"""Refuse to extract members outside of the destination, where the python version supports it.
+The archive is the user's own remote directory, so symlinks are kept as they are (as with `tar -xf`),
+even if they are absolute or point outside of the tree, which the "data" filter would refuse."""
+
+
+def _strip_tar_root(tar: tarfile.TarFile) -> Iterator[tarfile.TarInfo]:
+    """Yield the members of a tar archive of a single directory, relative to that directory.
+
+    Where the python version has no extraction filters, members that would be extracted
+    outside of the destination (absolute names, or `..` components) are refused here instead.
+    """
+    for member in tar:
+        member.name = member.name.partition("/")[2]
+        if not member.name:
+            continue
+        names = [member.name]
+        if member.islnk():
+            member.linkname = member.linkname.partition("/")[2]
+            names.append(member.linkname)
+        if not _TAR_EXTRACT_KWARGS and any(
+            posixpath.isabs(name) or ".." in name.split("/") for name in names
+        ):
+            raise tarfile.ExtractError(
+                f"Refusing to extract {member.name!r} outside of the destination"
+            )
+        yield member
+
+
+_CHECKSUM_ALGO = "sha256"
+"""The hash algorithm used by the FirecREST server for file checksums."""
+
+
+def _new_checksum_hash() -> hashlib._Hash:
+    """Return a new hash object for the server's checksum algorithm.
+
+    This is OpenSSL's implementation, which dispatches to the CPU's SHA extensions
+    (SHA-NI, ARMv8 Crypto Extensions) where available.
+    The digest is only used as an integrity check, so `usedforsecurity=False`
+    skips the FIPS bookkeeping on systems where that is enabled.
+    """
+    return hashlib.new(_CHECKSUM_ALGO, usedforsecurity=False)
+
+
+_MMAP_HASH_THRESHOLD = 16 * 1024 * 1024
+"""Files of at least this size are memory-mapped and hashed in a single call."""
+
+
+def _hash_file(path: str | Path) -> str:
+    """Return the hex digest of a local file, computed with the server's checksum algorithm."""
+    # all reads below are large, so skip the BufferedReader layer and its extra copy
+    with open(path, "rb", buffering=0) as handle:
+        if os.fstat(handle.fileno()).st_size >= _MMAP_HASH_THRESHOLD:
+            # hash straight from the page cache, without copying chunks into Python buffers
+            digest = _new_checksum_hash()
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                digest.update(mapped)
+            return digest.hexdigest()
+        if hasattr(os, "posix_fadvise"):
+            # the file is read once, front to back, so let the kernel read ahead aggressively
+            os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        if hasattr(hashlib, "file_digest"):
+            # python >= 3.11, the chunked read loop runs in C. It only needs `readinto`,
+            # which the raw file has too, although typeshed only accepts buffered readers
+            return hashlib.file_digest(
+                cast(BufferedReader, handle), _new_checksum_hash
+            ).hexdigest()
+        digest = _new_checksum_hash()
+        # read into a single reusable buffer, rather than allocating a new bytes object per chunk
+        buffer = bytearray(_TRANSFER_CHUNK_BYTES)
+        view = memoryview(buffer)
+        while size := handle.readinto(buffer):
+            digest.update(view[:size])
+    return digest.hexdigest()
+
+
+class _HashingWriter:
+    """A write-only file wrapper, which hashes the bytes on their way to the file.
+
+    This allows validating the checksum of a download without reading the file back from disk.
+    """
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._digest = _new_checksum_hash()
+
+    def write(self, data: bytes) -> int:
+        self._digest.update(data)
+        return self._handle.write(data)
+
+    def hexdigest(self) -> str:
+        """Return the hex digest of all bytes written so far."""
+        return self._digest.hexdigest()
+
+
+class _HashingReader:
+    """A read-only file wrapper, which hashes the bytes on their way out of the file.
+
+    This allows validating the checksum of an upload without reading the file twice.
+    """
+
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._digest = _new_checksum_hash()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._handle.read(size)
+        self._digest.update(data)
+        return data
+
+    def hexdigest(self) -> str:
+        """Return the hex digest of all bytes read so far."""
+        return self._digest.hexdigest()
+
+
+@lru_cache(maxsize=1024)
+def _normalize_path(path: str) -> str:
+    """Normalize a POSIX path, caching the result for paths that are resolved repeatedly."""
+    return posixpath.normpath(path)
+
+
+_CLIENT_CACHE: dict[tuple[str, str, str, str], Firecrest] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _get_client(url: str, token_uri: str, client_id: str, secret: str) -> Firecrest:
+    """Return a FirecREST client, shared between all transports with the same credentials.
+
+    Sharing the client also shares its authorization object and HTTP connections,
+    so the access token is not re-fetched every time a new transport is constructed.
+    """
+    key = (url, token_uri, client_id, secret)
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = Firecrest(
+                firecrest_url=url,
+                authorization=ClientCredentialsAuth(client_id, secret, token_uri),
+            )
+            _CLIENT_CACHE[key] = client
+    return client
+
+
+_MIN_API_VERSION = Version("1.15.0")
+"""The oldest supported version of the FirecREST api."""
+
+_TAR_API_VERSION = Version("1.16.0")
+"""The first version of the FirecREST api that supports transferring directories as tar files."""
+
+_SECRET_CACHE: dict[tuple[str, int], str] = {}
+
+
+def _read_secret(path: str) -> str:
+    """Return the secret stored in a file, re-reading it only when the file is modified.
+
+    The validation callbacks and every transport of a computer read the same secret file,
+    so a `stat` of it replaces opening and reading it each time.
+    """
+    key = (path, os.stat(path).st_mtime_ns)
+    secret = _SECRET_CACHE.get(key)
+    if secret is None:
+        secret = _SECRET_CACHE[key] = Path(path).read_text().strip()
+    return secret
+
+
+def close_clients() -> None:
+    """Drop all shared FirecREST clients, e.g. on shutdown or after credentials have changed."""
+    with _CLIENT_CACHE_LOCK:
+        _CLIENT_CACHE.clear()
+        _SECRET_CACHE.clear()
+
+
+_INIT_TYPES: tuple[tuple[str, type[Any]], ...] = (
+    ("url", str),
+    ("token_uri", str),
+    ("client_id", str),
+    ("client_secret", str),
+    ("compute_resource", str),
+    ("temp_directory", str),
+    ("api_version", str),
+    ("small_file_size_mb", float),
+)
+
+
+def _validate_init_types(*values: Any) -> None:
+    """Validate the types of the `FirecrestTransport` constructor arguments, in the order of `_INIT_TYPES`."""
+    for (name, expected), value in zip(_INIT_TYPES, values):
+        if not isinstance(value, expected):
+            raise TypeError(f"{name} must be of type {expected.__name__}")
+
+
+_GET_NAME = operator.itemgetter("name")
+
+_Walk = list[tuple[str, list[str], list[str]]]
+"""The steps of an `os.walk`, collected in a list so that they can be iterated again."""
+
+
+def _listed_path(parent: FcPath, entry: dict[str, Any]) -> FcPath:
+    """Return the path of a `list_files` entry of `parent` (its name is relative to `parent` for recursive
+    listings), with the mode and link target from the entry cached, as `FcPath.iterdir` does.
+    """
+    return parent._new_path(
+        parent._path / entry["name"],
+        _cache=_Cache(
+            lst_mode=_ls_to_st_mode(entry["type"], entry["permissions"]),
+            link_target=entry["link_target"],
+        ),
+    )
+
+
+@lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> Callable[[str], re.Match[str] | None]:
+    """Compile a Unix shell-style wildcard pattern into a matcher for the full name."""
+    return re.compile(fnmatch.translate(pattern)).fullmatch
+
+
+_MAGIC_CHECK = re.compile("[*?[]")
+
+
+@lru_cache(maxsize=4096)
+def _has_magic(string: str) -> bool:
+    """Whether a string contains any shell-style wildcard, cached as globbing checks the same strings repeatedly."""
+    return _MAGIC_CHECK.search(string) is not None
+
+
+@lru_cache(maxsize=256)
+def _compile_glob_union(
+    patterns: tuple[str, ...]
+) -> Callable[[str], re.Match[str] | None]:
+    """Compile several Unix shell-style wildcard patterns into one matcher,
+    which matches the names matched by any of them."""
+    return re.compile(
+        "|".join(f"(?:{fnmatch.translate(pattern)})" for pattern in patterns)
+    ).fullmatch
+
+
+_GLOB_CACHE_MAXSIZE = 512
+"""The maximum number of directory listings cached by each transport for globbing."""
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+def _invalidates_glob_cache(method: _F) -> _F:
+    """Decorate a `FirecrestTransport` method which modifies the remote,
+    so that the cached listings are forgotten once the change is done (or has failed).
+
+    Forgetting them only afterwards means that a listing made concurrently, before the change
+    took effect, cannot be cached again in between (see `_glob_listing`).
+    """
+
+    @wraps(method)
+    def wrapper(self: FirecrestTransport, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_glob_cache()
+
+    return wrapper  # type: ignore[return-value]
+
+
+def _reuses_listings(method: _F) -> _F:
+    """Decorate a `FirecrestTransport` method which checks several paths before acting on them,
+    so that `isdir`, `isfile` and `path_exists` answer from the listings made during the call,
+    rather than sending a request each.
+
+    Outside of such a method, these checks always reflect the current state of the remote.
+    """
+
+    @wraps(method)
+    def wrapper(self: FirecrestTransport, *args: Any, **kwargs: Any) -> Any:
+        with self._glob_cache_lock:
+            self._listing_scope_depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            with self._glob_cache_lock:
+                self._listing_scope_depth -= 1
+                if not self._listing_scope_depth:
+                    self._scope_listings.clear()
+
+    return wrapper  # type: ignore[return-value]
+
+
+_GLOB_ENTRY_IS_DIR: dict[str, bool | None] = {"d": True, "l": None}
+"""Whether a `list_files` entry of the given type is a directory (None for symlinks, which may be)."""
+
+
 def _create_secret_file(ctx: Context, param: InteractiveOption, value: str) -> str:
     """Create a secret file if the value is not a path to a secret file.
     The path should be absolute, if it is not, the file will be created in ~/.firecrest.
@@ -89,33 +416,34 @@ def _validate_temp_directory(ctx: Context, param: InteractiveOption, value: str)
     )
 
     # Temp directory routine
-    if transport._cwd.joinpath(
-        transport._temp_directory
-    ).is_file():  # self._temp_directory.is_file():
+    # `_temp_directory` is cached, so the mode is fetched only once for both checks below
+    temp_directory = transport._temp_directory
+    if temp_directory.is_file():
         raise click.BadParameter("Temp directory cannot be a file")
 
-    if transport.path_exists(transport._temp_directory):
-        if transport.listdir(transport._temp_directory):
+    if temp_directory.is_dir():
+        if transport.listdir(temp_directory):
             # if not configured:
             confirm = click.confirm(
-                f"Temp directory {transport._temp_directory} is not empty. Do you want to flush it?"
+                f"Temp directory {temp_directory} is not empty. Do you want to flush it?"
             )
             if confirm:
-                for item in transport.listdir(transport._temp_directory):
-                    # TODO: maybe do recursive delete
-                    transport.remove(transport._temp_directory.joinpath(item))
+                # reset the directory with a single recursive delete,
+                # rather than removing the items one by one
+                temp_directory.rmtree()
+                transport.mkdir(temp_directory)
             else:
                 click.echo("Please provide an empty temp directory on the server.")
                 raise click.BadParameter(
-                    f"Temp directory {transport._temp_directory} is not empty"
+                    f"Temp directory {temp_directory} is not empty"
                 )
 
     else:
         try:
-            transport.mkdir(transport._temp_directory, ignore_existing=True)
+            transport.mkdir(temp_directory, ignore_existing=True)
         except Exception as e:
             raise click.BadParameter(
-                f"Could not create temp directory {transport._temp_directory} on server: {e}"
+                f"Could not create temp directory {temp_directory} on server: {e}"
             ) from e
     click.echo(
         click.style("Fireport: ", bold=True, fg="magenta")
@@ -141,12 +469,12 @@ def _dynamic_info_firecrest_version(
 
     if value != "None":
         try:
-            parse(value)
+            version = parse(value)
         except InvalidVersion as err:
             # raise in case the version is not valid, e.g. latest, stable, etc.
             raise click.BadParameter(f"Invalid input {value}") from err
 
-        if parse(value) < parse("1.15.0"):
+        if version < _MIN_API_VERSION:
             raise click.BadParameter(f"FirecREST api version {value} is not supported")
         # If version is provided by the user, and it's supported, we will just return it.
         # No print confirmation is needed, to keep things less verbose.
@@ -188,7 +516,7 @@ def _dynamic_info_firecrest_version(
         click.echo("Could not get the version of the FirecREST server")
         raise click.Abort() from err
 
-    if parse(_version) < parse("1.15.0"):
+    if parse(_version) < _MIN_API_VERSION:
         click.echo(f"FirecREST api version {_version} is not supported")
         raise click.Abort()
 
@@ -388,16 +716,16 @@ class FirecrestTransport(Transport):
         kwargs.setdefault("safe_interval", 0)
         super().__init__(**kwargs)  # type: ignore
 
-        assert isinstance(url, str), "url must be a string"
-        assert isinstance(token_uri, str), "token_uri must be a string"
-        assert isinstance(client_id, str), "client_id must be a string"
-        assert isinstance(client_secret, str), "client_secret must be a string"
-        assert isinstance(compute_resource, str), "compute_resource must be a string"
-        assert isinstance(temp_directory, str), "temp_directory must be a string"
-        assert isinstance(api_version, str), "api_version must be a string"
-        assert isinstance(
-            small_file_size_mb, float
-        ), "small_file_size_mb must be a float"
+        _validate_init_types(
+            url,
+            token_uri,
+            client_id,
+            client_secret,
+            compute_resource,
+            temp_directory,
+            api_version,
+            small_file_size_mb,
+        )
 
         self._machine = compute_resource
         self._url = url
@@ -407,22 +735,20 @@ class FirecrestTransport(Transport):
 
         self._payoff_override: bool | None = None
 
-        secret = Path(client_secret).read_text().strip()
+        secret = _read_secret(client_secret)
         try:
-            self._client = Firecrest(
-                firecrest_url=self._url,
-                authorization=ClientCredentialsAuth(client_id, secret, token_uri),
-            )
+            self._client = _get_client(self._url, token_uri, client_id, secret)
         except Exception as e:
             raise ValueError(f"Could not connect to FirecREST server: {e}") from e
 
         self._cwd: FcPath = FcPath(self._client, self._machine, "/", cache_enabled=True)
         self._temp_directory = self._cwd.joinpath(temp_directory)
 
-        self._api_version: Version = parse(api_version)
-
-        if self._api_version < parse("1.16.0"):
-            self._payoff_override = False
+        # only the format of the version is checked here, it is compared once first needed
+        try:
+            self._api_version: Version = parse(api_version)
+        except InvalidVersion as err:
+            raise ValueError(f"Invalid FirecREST api version: {api_version}") from err
 
         # this makes no sense for firecrest, but we need to set this to True
         # otherwise the aiida-core will complain that the transport is not open:
@@ -431,6 +757,25 @@ class FirecrestTransport(Transport):
 
         self.checksum_check = False
 
+        # the maximum number of files transferred concurrently by `gettree` and `puttree`
+        self.max_io_concurrency = 8
+
+        # directories are only transferred as tar files if their entries are on average smaller than this (MB)
+        self.payoff_size_threshold_mb = 10.0
+
+        # directory listings are reused by globbing for this many seconds (0 disables the cache),
+        # or until this transport modifies the remote
+        self.glob_cache_ttl = 5.0
+        self._glob_cache: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = (
+            OrderedDict()
+        )
+        self._glob_cache_lock = threading.Lock()
+        # bumped whenever the cache is invalidated, so that listings requested before then are not cached
+        self._glob_cache_generation = 0
+        # the listings reused by the path checks of the methods decorated with `_reuses_listings`
+        self._listing_scope_depth = 0
+        self._scope_listings: dict[str, list[dict[str, Any]]] = {}
+
     def __str__(self) -> str:
         """Return the name of the plugin."""
         return self.__class__.__name__
@@ -441,6 +786,9 @@ class FirecrestTransport(Transport):
 
     @property
     def payoff_override(self) -> bool | None:
+        if self._payoff_override is None and self._api_version < _TAR_API_VERSION:
+            # transferring directories as tar files is not supported before 1.16.0
+            return False
         return self._payoff_override
 
     @payoff_override.setter
@@ -467,7 +815,7 @@ class FirecrestTransport(Transport):
 
     def _get_path(self, *path: str) -> str:
         """Return the path as a string."""
-        return posixpath.normpath(self._cwd.joinpath(*path))  # type: ignore
+        return _normalize_path(str(self._cwd.joinpath(*path)))
 
     def chdir(self, path: str) -> None:
         """Change the current working directory."""
@@ -476,21 +824,46 @@ class FirecrestTransport(Transport):
             raise OSError(f"'{new_path}' is not a valid directory")
         self._cwd = new_path
 
-    def chmod(self, path: str, mode: str) -> None:
-        """Change the mode of a file."""
-        self._cwd.joinpath(path).chmod(mode)
+    def chmod(self, path: str, mode: int | str) -> None:
+        """Change the mode of a file.
+
+        :param mode: the numeric mode, as an integer (e.g. `0o755`) or an octal string (e.g. `"755"`)
+        """
+        # the server expects the octal digits, as passed to the `chmod` command
+        mode_str = mode if isinstance(mode, str) else f"{mode:o}"
+        with convert_header_exceptions(
+            {"machine": self._machine, "path": path, "mode": mode_str}
+        ):
+            self._client.chmod(self._machine, str(self._cwd.joinpath(path)), mode_str)
 
     def chown(self, path: str, uid: str, gid: str) -> None:
         """Change the owner of a file."""
         self._cwd.joinpath(path).chown(uid, gid)
 
     def path_exists(self, path: str) -> bool:
-        """Check if a path exists on the remote."""
-        return self._cwd.joinpath(path).exists()  # type: ignore
+        """Check if a path exists on the remote.
+
+        This is the literal fast path of `iglob`, so it sends a single `stat` request
+        (`FcPath.exists` additionally lists the parent directory to get the mode, which is not needed here).
+        """
+        ftype = self._entry_type(path, fetch=False)
+        if ftype is not None and ftype != "l":
+            return ftype != ""
+        path_abs = self._cwd.joinpath(path)
+        try:
+            with path_abs.convert_header_exceptions():
+                self._client.stat(self._machine, str(path_abs), dereference=True)
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return True
 
     def get_attribute(self, path: str) -> FileAttribute:
         """Get the attributes of a file."""
-        result = self._cwd.joinpath(path).stat()
+        return self._get_attribute(self._cwd.joinpath(path))
+
+    def _get_attribute(self, path: FcPath) -> FileAttribute:
+        """Get the attributes of a file, reusing any mode cached on the path."""
+        result = path.stat()
         return FileAttribute(  # type: ignore
             {
                 "st_size": result.st_size,
@@ -504,11 +877,54 @@ class FirecrestTransport(Transport):
 
     def isdir(self, path: str) -> bool:
         """Check if a path is a directory."""
-        return self._cwd.joinpath(path).is_dir()  # type: ignore
+        ftype = self._entry_type(path, fetch=True)
+        if ftype is None or ftype == "l":
+            return self._cwd.joinpath(path).is_dir()  # type: ignore
+        return ftype == "d"
 
     def isfile(self, path: str) -> bool:
         """Check if a path is a file."""
-        return self._cwd.joinpath(path).is_file()  # type: ignore
+        ftype = self._entry_type(path, fetch=True)
+        if ftype is None or ftype == "l":
+            return self._cwd.joinpath(path).is_file()  # type: ignore
+        return ftype == "-"
+
+    def _entry_type(self, path: str, fetch: bool, fresh: bool = False) -> str | None:
+        """Return the `list_files` type of a path, from the listing of its parent directory.
+
+        Within a method decorated with `_reuses_listings`, the checks of the same path, or of paths
+        in the same directory, are answered by a single listing, until this transport modifies the remote.
+        Otherwise the parent directory is listed anew, so that changes made by others are seen.
+
+        :param fetch: whether to list the parent directory if there is no reusable listing of it.
+        :param fresh: whether to always list the parent directory anew, ignoring any reusable listing.
+        :return: the type, an empty string if the path does not exist,
+            or None if it is not known (the path is the root, or no reusable listing and not `fetch`).
+        """
+        path_abs = str(self._cwd.joinpath(path))
+        parent, name = posixpath.split(path_abs)
+        if not name:
+            return None
+        with self._glob_cache_lock:
+            entries = None if fresh else self._scope_listings.get(parent)
+            generation = self._glob_cache_generation
+        if entries is None:
+            if not fetch:
+                return None
+            try:
+                entries = self._list_files(parent)
+            except (FileNotFoundError, NotADirectoryError):
+                return ""
+            with self._glob_cache_lock:
+                if (
+                    self._listing_scope_depth
+                    and generation == self._glob_cache_generation
+                ):
+                    self._scope_listings[parent] = entries
+        for entry in entries:
+            if entry["name"] == name:
+                return str(entry["type"])
+        return ""
 
     def listdir(
         self, path: str = ".", pattern: str | None = None, recursive: bool = False
@@ -525,25 +941,307 @@ class FirecrestTransport(Transport):
             - `[!seq]` matches any character not in seq
         :param recursive: If True, list directories recursively
         """
+        if (
+            pattern
+            and not _has_magic(pattern)
+            and "/" not in pattern
+            and pattern not in (".", "..")
+            and self.path_exists(posixpath.join(str(path), pattern))
+        ):
+            # a literal pattern can only match the entry of that name, so a single `stat`
+            # replaces the listing of the whole directory (misses still list it, to raise as before)
+            return [pattern]
+        # project the names straight from the `list_files` results,
+        # rather than constructing an `FcPath` for every entry
+        names = map(_GET_NAME, self._list_files(path, recursive=recursive))
+        if pattern is None:
+            return list(names)
+        return list(filter(_compile_glob(pattern), names))
+
+    def _list_files(self, path: str, recursive: bool = False) -> list[dict[str, Any]]:
+        """Return the raw `list_files` entries of a directory, including hidden ones."""
         path_abs = self._cwd.joinpath(path)
-        names = [p.relpath(path_abs) for p in path_abs.iterdir(recursive=recursive)]
-        if pattern is not None:
-            names = fnmatch.filter(names, pattern)
+        with path_abs.convert_header_exceptions():
+            # the entries are only read by key, so they are handled as plain dicts
+            return cast(
+                "list[dict[str, Any]]",
+                self._client.list_files(
+                    self._machine, str(path_abs), show_hidden=True, recursive=recursive
+                ),
+            )
+
+    def _glob_listing(self, dirname: str) -> list[dict[str, Any]]:
+        """Return the `list_files` entries of a directory to glob in.
+
+        Listings are reused for `glob_cache_ttl` seconds (the remote may also be modified by running jobs),
+        keeping at most the `_GLOB_CACHE_MAXSIZE` most recently used ones.
+        """
+        if self.glob_cache_ttl <= 0:
+            return self._list_files(dirname)
+        cached = self._cached_glob_listing(dirname)
+        if cached is not None:
+            return cached
+        key = str(self._cwd.joinpath(dirname))
+        now = time.monotonic()
+        generation = self._glob_cache_generation
+        entries = self._list_files(dirname)
+        with self._glob_cache_lock:
+            if generation != self._glob_cache_generation:
+                # the remote was modified while listing, so the entries may predate the change
+                return entries
+            self._glob_cache[key] = (now, entries)
+            self._glob_cache.move_to_end(key)
+            if len(self._glob_cache) > _GLOB_CACHE_MAXSIZE:
+                self._glob_cache.popitem(last=False)
+        return entries
+
+    def _cached_glob_listing(self, dirname: str) -> list[dict[str, Any]] | None:
+        """Return the cached listing of a directory, if there is a fresh one, without any request."""
+        key = str(self._cwd.joinpath(dirname))
+        with self._glob_cache_lock:
+            cached = self._glob_cache.get(key)
+            if cached is None or time.monotonic() - cached[0] >= self.glob_cache_ttl:
+                return None
+            self._glob_cache.move_to_end(key)
+            return cached[1]
+
+    def _invalidate_glob_cache(self) -> None:
+        """Forget the cached listings, as this transport has modified the remote."""
+        with self._glob_cache_lock:
+            self._glob_cache_generation += 1
+            self._glob_cache.clear()
+            self._scope_listings.clear()
+
+    def _stat_many(self, parent: str, names: list[str]) -> dict[str, str | None]:
+        """Return the `list_files` types (`-`, `d`, `l`, ...) of several entries of a directory,
+        from a single (possibly cached) listing of it, rather than one listing per entry.
+
+        Names that are not in the directory map to None.
+        """
+        types = {entry["name"]: entry["type"] for entry in self._glob_listing(parent)}
+        return {name: types.get(name) for name in names}
+
+    def _isfile_many(self, paths: list[str]) -> list[bool]:
+        """Check which of the paths are files, with one listing per parent directory.
+
+        Symlinks are resolved with `isfile`, as the listing only reveals the type of the link itself.
+        """
+        names_by_parent: dict[str, list[str]] = {}
+        for path in paths:
+            parent, name = posixpath.split(path)
+            names_by_parent.setdefault(parent, []).append(name)
+        types = {
+            parent: self._stat_many(parent, names)
+            for parent, names in names_by_parent.items()
+        }
+        result = []
+        for path in paths:
+            parent, name = posixpath.split(path)
+            ftype = types[parent][name]
+            result.append(self.isfile(path) if ftype == "l" else ftype == "-")
+        return result
+
+    def listdir_withattributes(
+        self, path: str = ".", pattern: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List the contents of a directory, with the attributes of each entry.
+
+        The modes of all entries come from a single listing of the directory,
+        so that only one `stat` call is needed per entry
+        (the default implementation also fetches the mode and `isdir` separately for each entry),
+        and these calls are made concurrently (see `_map_concurrently`).
+
+        :param path: this could be relative or absolute path.
+        :param pattern: Unix shell-style wildcards to match the names against.
+        """
+        matcher = _compile_glob(pattern) if pattern is not None else None
+        items = [
+            item
+            for item in self._cwd.joinpath(path).iterdir()
+            if matcher is None or matcher(item.name)
+        ]
+        attributes = self._map_concurrently(self._get_attribute, items)
+        return [
+            {"name": item.name, "attributes": attribute, "isdir": item.is_dir()}
+            for item, attribute in zip(items, attributes)
+        ]
+
+    def iglob(self, pathname: str) -> Iterator[str]:
+        """Return an iterator which yields the paths matching a pathname pattern.
+
+        The pattern may contain simple shell-style wildcards a la fnmatch.
+        Same as the default implementation, except that the directories matched by a magic
+        `dirname` are globbed concurrently, rather than one request after the other,
+        and that what the listings reveal about each entry is reused for the whole pattern.
+        """
+        yield from self._iglob(pathname, {})
+
+    def has_magic(self, string: str) -> bool:
+        """Whether a string contains any shell-style wildcard."""
+        return _has_magic(string)
+
+    def _iglob(
+        self, pathname: str, stat_cache: dict[str, bool | None]
+    ) -> Iterator[str]:
+        """Implementation of `iglob`.
+
+        :param stat_cache: maps the paths seen in directory listings to whether they are directories
+            (None if unknown, i.e. for symlinks). It is shared by all the steps of one `iglob` call.
+        """
+        if not _has_magic(pathname):
+            if pathname in stat_cache or self.path_exists(pathname):
+                yield pathname
+            return
+        dirname, basename = posixpath.split(pathname)
+        if not dirname:
+            yield from self._glob1(self.getcwd(), basename, {})
+            return
+        if basename and not _has_magic(basename):
+            # fold the literal components after the last magic one into the basename,
+            # so that they are checked with a single request, rather than one per component
+            while True:
+                head, tail = posixpath.split(dirname)
+                if not tail or _has_magic(tail):
+                    break
+                dirname, basename = head, posixpath.join(tail, basename)
+        magic_basename = _has_magic(basename)
+        magic_dirname = _has_magic(dirname)
+        if magic_dirname:
+            # files cannot contain matches, so there is no need to glob inside them
+            dirs = [
+                directory
+                for directory in self._iglob(dirname, stat_cache)
+                if stat_cache.get(directory) is not False
+            ]
+        else:
+            dirs = [dirname]
+        glob_in_dir = self._glob1 if magic_basename else self._glob0
+
+        def glob_in(directory: str) -> list[str]:
+            if magic_basename and magic_dirname and stat_cache.get(directory) is None:
+                # a listing of a file would list the file itself, so the type of the paths the listings
+                # did not reveal (symlinks, literal components) is checked first, in the same task,
+                # so that it overlaps with the globbing of the other directories
+                stat_cache[directory] = self.isdir(directory)
+                if not stat_cache[directory]:
+                    return []
+            return glob_in_dir(directory, basename, stat_cache)
+
+        # matches are yielded as soon as their directory has been globbed,
+        # rather than once all directories have been
+        results = self._imap_concurrently(glob_in, dirs)
+        for directory, names in zip(dirs, results):
+            # names are never absolute, so joining them is a plain concatenation
+            prefix = directory if directory.endswith("/") else directory + "/"
+            for name in names:
+                yield prefix + name
+
+    def glob1(self, dirname: str, pattern: str) -> list[str]:
+        """Match subpaths of dirname against pattern.
+
+        Same as the default implementation, except that the compiled pattern is cached,
+        as the same basename is matched in every directory globbed by `iglob`.
+        """
+        return self._glob1(dirname, pattern, {})
+
+    def _glob1(
+        self, dirname: str, pattern: str, stat_cache: dict[str, bool | None]
+    ) -> list[str]:
+        """Implementation of `glob1`, which records the type of each listed entry in `stat_cache`."""
+        if not dirname:
+            dirname = self.getcwd()
+        try:
+            entries = self._glob_listing(dirname)
+        except OSError:
+            return []
+        # `*` (by far the most common pattern) matches every name that is not hidden
+        matcher = None if pattern == "*" else _compile_glob(pattern)
+        hidden = pattern[0] == "."
+        prefix = dirname if dirname.endswith("/") else dirname + "/"
+        names = []
+        for entry in entries:
+            name = entry["name"]
+            if (hidden or name[0] != ".") and (matcher is None or matcher(name)):
+                names.append(name)
+                stat_cache[prefix + name] = _GLOB_ENTRY_IS_DIR.get(entry["type"], False)
         return names
 
-    # TODO the default implementations of glob / iglob could be overridden
-    # to be more performant, using cached FcPaths and https://github.com/chrisjsewell/virtual-glob
+    def glob_many(self, dirname: str, patterns: list[str]) -> dict[str, list[str]]:
+        """Match the entries of a directory against several patterns, with a single listing.
 
+        :return: the names matched by each pattern, as `glob1` would return them for it.
+        """
+        results: dict[str, list[str]] = {pattern: [] for pattern in patterns}
+        if not patterns:
+            return results
+        if not dirname:
+            dirname = self.getcwd()
+        try:
+            names = list(map(_GET_NAME, self._glob_listing(dirname)))
+        except OSError:
+            return results
+        # most names usually match none of the patterns, so discard those with a single regex,
+        # and only match the remaining ones against each pattern
+        any_matcher = _compile_glob_union(tuple(patterns))
+        matchers = [
+            (matched, pattern[0] == ".", _compile_glob(pattern))
+            for pattern, matched in results.items()
+        ]
+        for name in names:
+            if not any_matcher(name):
+                continue
+            visible = name[0] != "."
+            for matched, hidden, matcher in matchers:
+                if (hidden or visible) and matcher(name):
+                    matched.append(name)
+        return results
+
+    def glob0(self, dirname: str, basename: str) -> list[str]:
+        """Wrap basename in a list if it is empty or if dirname/basename is an existing path,
+        else return an empty list."""
+        return self._glob0(dirname, basename, {})
+
+    def _glob0(
+        self, dirname: str, basename: str, stat_cache: dict[str, bool | None]
+    ) -> list[str]:
+        """Implementation of `glob0`, which answers from `stat_cache` where possible."""
+        if basename == "":
+            # `posixpath.split()` returns an empty basename for paths ending with a
+            # directory separator.  'q*x/' should match only directories.
+            is_dir = stat_cache.get(dirname)
+            if is_dir is None:
+                is_dir = self.isdir(dirname)
+            return [basename] if is_dir else []
+        path = posixpath.join(dirname, basename)
+        if path in stat_cache:
+            return [basename]
+        if "/" not in basename:
+            # a recent listing of the parent directory answers without a request
+            entries = self._cached_glob_listing(dirname)
+            if entries is not None:
+                return [basename] if basename in map(_GET_NAME, entries) else []
+        return [basename] if self.path_exists(path) else []
+
+    @_invalidates_glob_cache
     def makedirs(self, path: str, ignore_existing: bool = False) -> None:
         """Make directories on the remote."""
         new_path = self._cwd.joinpath(path)
-        if not ignore_existing and new_path.exists():
-            # Note: FirecREST does not raise an error if the directory already exists, and parent is True.
-            # which makes sense, but following the Superclass, we should raise an OSError in that case.
+        if ignore_existing:
+            new_path.mkdir(parents=True, exist_ok=True)
+            return
+        # Note: FirecREST does not raise an error if the directory already exists, and parent is True.
+        # which makes sense, but following the Superclass, we should raise an OSError in that case.
+        # Rather than checking for existence first, optimistically create the leaf directory,
+        # which fails if it already exists, and only create the parents if they are missing.
+        try:
+            new_path.mkdir()
+        except FileExistsError as err:
             # AiiDA expects an OSError, instead of a FileExistsError
-            raise OSError(f"'{path}' already exists")
-        self._cwd.joinpath(path).mkdir(parents=True, exist_ok=ignore_existing)
+            raise OSError(f"'{path}' already exists") from err
+        except FileNotFoundError:
+            new_path.mkdir(parents=True)
 
+    @_invalidates_glob_cache
     def mkdir(self, path: str, ignore_existing: bool = False) -> None:
         """Make a directory on the remote."""
         try:
@@ -553,8 +1251,9 @@ class FirecrestTransport(Transport):
 
     def normalize(self, path: str = ".") -> str:
         """Resolve the path."""
-        return posixpath.normpath(path)
+        return _normalize_path(path)
 
+    @_invalidates_glob_cache
     def write_binary(self, path: str, data: bytes) -> None:
         """Write bytes to a file on the remote."""
         # Note this is not part of the Transport interface, but is useful for testing
@@ -567,12 +1266,17 @@ class FirecrestTransport(Transport):
         # TODO will fail for files exceeding small_file_size_mb
         return self._cwd.joinpath(path).read_bytes()  # type: ignore
 
+    @_invalidates_glob_cache
     def symlink(self, remotesource: str, remotedestination: str) -> None:
         """Create a symlink on the remote."""
-        source = self._cwd.joinpath(remotesource)
-        destination = self._cwd.joinpath(remotedestination)
-        destination.symlink_to(source)
+        # both paths are joined onto the (absolute) cwd, so there is no need to
+        # re-validate that the source is absolute, as `FcPath.symlink_to` would do
+        source = str(self._cwd.joinpath(remotesource))
+        destination = str(self._cwd.joinpath(remotedestination))
+        with self._cwd.convert_header_exceptions():
+            self._client.symlink(self._machine, source, destination)
 
+    @_reuses_listings
     def copyfile(
         self, remotesource: str, remotedestination: str, dereference: bool = False
     ) -> None:
@@ -588,17 +1292,17 @@ class FirecrestTransport(Transport):
         )  # .enable_cache() it's removed from from path.py to be investigated
         if dereference:
             raise NotImplementedError("copyfile() does not support symlink dereference")
-        if not source.exists():
-            raise FileNotFoundError(f"Source file does not exist: {source}")
-        if not source.is_file():
+        # a single listing of the parent tells both the kind and (reusing it) the existence
+        if not self.isfile(str(source)):
+            if not self.path_exists(str(source)):
+                raise FileNotFoundError(f"Source file does not exist: {source}")
             raise ValueError(f"Source is not a file: {source}")
-        if not destination.exists() and not source.is_file():
-            raise FileNotFoundError(f"Destination file does not exist: {destination}")
 
         self._copy_to(source, destination)
         # I removed symlink copy, becasue it's really not a file copy, it's a link copy
         # and aiida-ssh have it in buggy manner, prrobably it's not used anyways
 
+    @_invalidates_glob_cache
     def _copy_to(self, source: FcPath, target: FcPath) -> None:
         """Copy source path to the target path. Both paths must be on remote.
 
@@ -610,6 +1314,7 @@ class FirecrestTransport(Transport):
             # https://github.com/eth-cscs/firecrest/blob/7f02d11b224e4faee7f4a3b35211acb9c1cc2c6a/src/utilities/utilities.py#L320
             self._client.copy(self._machine, str(source), str(target))
 
+    @_reuses_listings
     def copytree(
         self, remotesource: str, remotedestination: str, dereference: bool = False
     ) -> None:
@@ -629,15 +1334,17 @@ class FirecrestTransport(Transport):
             raise NotImplementedError(
                 "Dereferencing not implemented in FirecREST server"
             )
-        if not source.exists():
-            raise FileNotFoundError(f"Source file does not exist: {source}")
-        if not source.is_dir():
+        # a single listing of the parent tells both the kind and (reusing it) the existence
+        if not self.isdir(str(source)):
+            if not self.path_exists(str(source)):
+                raise FileNotFoundError(f"Source file does not exist: {source}")
             raise ValueError(f"Source is not a directory: {source}")
-        if not destination.exists():
+        if not self.path_exists(str(destination)):
             raise FileNotFoundError(f"Destination file does not exist: {destination}")
 
         self._copy_to(source, destination)
 
+    @_reuses_listings
     def copy(
         self,
         remotesource: str,
@@ -663,16 +1370,29 @@ class FirecrestTransport(Transport):
                 "Dereferencing not implemented in FirecREST server"
             )
 
-        if self.has_magic(str(remotesource)):  # type: ignore
-            for item in self.iglob(remotesource):  # type: ignore
+        remotesource = str(remotesource)
+        if self.has_magic(remotesource):
+            # the types of all matches are checked before copying, from the listings made by
+            # globbing, rather than with a listing of the parent directory for each match
+            items = list(self.iglob(remotesource))
+            pairs = [
                 # item is of str type, so we need to split it to get the file name
-                filename = item.split("/")[-1] if self.isfile(item) else ""
+                (item, remotedestination + (item.split("/")[-1] if is_file else ""))
+                for item, is_file in zip(items, self._isfile_many(items))
+            ]
+
+            def copy_item(source: str, destination: str) -> None:
                 self.copy(
-                    item,
-                    remotedestination + filename,
-                    dereference=dereference,
-                    recursive=recursive,
+                    source, destination, dereference=dereference, recursive=recursive
                 )
+
+            if len({item.split("/")[-1] for item in items}) == len(items):
+                # each copy is a blocking request to the server, so they are overlapped,
+                # unless several matches land on the same name, where the last one must win
+                self._transfer_concurrently(copy_item, pairs)
+            else:
+                for pair in pairs:
+                    copy_item(*pair)
             return
 
         source = self._cwd.joinpath(
@@ -682,9 +1402,11 @@ class FirecrestTransport(Transport):
             remotedestination
         )  # .enable_cache() it's removed from from path.py to be investigated
 
-        if not source.exists():
+        # a single listing of the parent tells both the kind and (reusing it) the existence
+        source_is_file = self.isfile(str(source))
+        if not source_is_file and not self.path_exists(str(source)):
             raise FileNotFoundError(f"Source does not exist: {source}")
-        if not destination.exists() and not source.is_file():
+        if not source_is_file and not self.path_exists(str(destination)):
             raise FileNotFoundError(f"Destination does not exist: {destination}")
 
         self._copy_to(source, destination)
@@ -726,9 +1448,32 @@ class FirecrestTransport(Transport):
         remote_size = remote.lstat().st_size
         # if not local.exists():
         #     local.mkdir(parents=True)
+        if self.checksum_check:
+            # hash the bytes while they are written, rather than reading the file back afterwards
+            with open(local, "wb", buffering=_TRANSFER_CHUNK_BYTES) as handle:
+                writer = _HashingWriter(handle)
+                self._download(remote, remote_size, writer)
+            self._validate_checksum(local, remote, local_hash=writer.hexdigest())
+        else:
+            self._download(remote, remote_size, local)
+
+    def _download(
+        self,
+        remote: FcPath,
+        remote_size: int,
+        target: Path | IO[bytes] | _HashingWriter,
+    ) -> None:
+        """Download a remote file to a local path or writable file object.
+
+        Small files are sent in a single API call, larger ones go through the object store.
+        """
+        # pyfirecrest only calls `write` on file objects, so any writable binary stream works,
+        # although it annotates them as the concrete `BytesIO` and `BufferedWriter` types
         with self._cwd.convert_header_exceptions():
             if remote_size < self._small_file_size_bytes:
-                self._client.simple_download(self._machine, str(remote), localpath)
+                self._client.simple_download(
+                    self._machine, str(remote), cast("Path | BytesIO", target)
+                )
             else:
                 # TODO the following is a very basic implementation of downloading a large file
                 # ideally though, if downloading multiple large files (i.e. in gettree),
@@ -740,18 +1485,21 @@ class FirecrestTransport(Transport):
                 # Becasue in the end, FirecREST server ends up serializing the requests.
                 # see here: https://github.com/eth-cscs/pyfirecrest/issues/94
                 down_obj = self._client.external_download(self._machine, str(remote))
-                down_obj.finish_download(local)
-
-        if self.checksum_check:
-            self._validate_checksum(local, remote)
+                down_obj.finish_download(cast("Path | BufferedWriter", target))
 
     def _validate_checksum(
-        self, localpath: str | Path, remotepath: str | FcPath
+        self,
+        localpath: str | Path,
+        remotepath: str | FcPath,
+        local_hash: str | None = None,
     ) -> None:
         """Validate the checksum of a file.
         Useful for checking if a file was transferred correctly.
         it uses sha256 hash to compare the checksum of the local and remote files.
 
+        :param local_hash: the hash of the local file, if it is already known
+            (e.g. computed during the transfer), in which case the file is not read again.
+
         Raises: ValueError: If the checksums do not match.
         """
 
@@ -770,21 +1518,24 @@ class FirecrestTransport(Transport):
                 f"Cannot calculate checksum for a directory: {remote}"
             )
 
-        sha256_hash = hashlib.sha256()
-        with open(local, "rb") as f:
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
-        local_hash = sha256_hash.hexdigest()
-
-        remote_hash = self._client.checksum(self._machine, remote)
+        if local_hash is None:
+            # the remote checksum is a blocking request, so overlap it with hashing the local file
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                remote_future = executor.submit(
+                    self._client.checksum, self._machine, str(remote)
+                )
+                local_hash = _hash_file(local)
+                remote_hash = remote_future.result()
+        else:
+            remote_hash = self._client.checksum(self._machine, str(remote))
 
-        try:
-            assert local_hash == remote_hash
-        except AssertionError as e:
+        # an explicit check, as asserts are stripped when python runs with -O
+        if local_hash != remote_hash:
             raise ValueError(
                 f"Checksum mismatch between local and remote files: {local} and {remote}"
-            ) from e
+            )
 
+    @_invalidates_glob_cache
     def _gettreetar(
         self,
         remotepath: str | FcPath,
@@ -809,23 +1560,33 @@ class FirecrestTransport(Transport):
             self._machine, str(remotepath), remote_path_temp, dereference=dereference
         )
 
-        # Download
-        localpath_temp = Path(localpath).joinpath(f"temp_{_}.tar")
-        try:
-            self.getfile(remote_path_temp, localpath_temp)
-        finally:
-            self.remove(remote_path_temp)
-
-        # Extract the downloaded file locally
-        try:
-            # with tarfile.open(localpath_temp, "r") as tar:
-            #     members = [m for m in tar.getmembers() if m.name.startswith(remotepath.name)]
-            #     for member in members:
-            #         member.name = os.path.relpath(member.name, remotepath.name)
-            #         tar.extract(member, path=localpath)
-            os.system(f"tar -xf '{localpath_temp}' --strip-components=1 -C {localpath}")
-        finally:
-            localpath_temp.unlink()
+        # Download into an unnamed temporary file on the destination filesystem
+        # (O_TMPFILE where supported), which never appears in `localpath` and is gone once closed
+        with tempfile.TemporaryFile(
+            dir=localpath, buffering=_TRANSFER_CHUNK_BYTES
+        ) as handle:
+            try:
+                remote_temp = self._cwd.joinpath(str(remote_path_temp))
+                remote_size = remote_temp.lstat().st_size
+                if self.checksum_check:
+                    writer = _HashingWriter(handle)
+                    self._download(remote_temp, remote_size, writer)
+                    self._validate_checksum(
+                        localpath, remote_temp, local_hash=writer.hexdigest()
+                    )
+                else:
+                    self._download(remote_temp, remote_size, handle)
+            finally:
+                self._remove_temp_file(remote_path_temp)
+
+            # Extract the downloaded file locally, in-process and in a single sequential pass,
+            # stripping the leading path component (the name of the remote directory).
+            # `extractall` sets the attributes of directories last, so that read-only ones can be filled
+            handle.seek(0)
+            with tarfile.open(fileobj=handle, mode="r|*") as tar:
+                tar.extractall(
+                    localpath, members=_strip_tar_root(tar), **_TAR_EXTRACT_KWARGS
+                )
 
     def gettree(
         self,
@@ -847,14 +1608,14 @@ class FirecrestTransport(Transport):
         if local.is_file():
             raise OSError("Cannot copy a directory into a file")
 
+        # derive from the cached working directory (unless the path already is a cached one, e.g. from
+        # `get` or a symlink below, whose mode is then not requested again), so that the stat modes
+        # returned by the listing below are kept on each item, instead of being requested for every check
         remote = (
             remotepath
-            if isinstance(remotepath, FcPath)
-            else self._cwd.joinpath(
-                remotepath
-            )  # .enable_cache() it's removed from from path.py to be investigated
+            if isinstance(remotepath, FcPath) and remotepath.cache_enabled
+            else self._cwd.joinpath(str(remotepath))
         )
-        local = Path(localpath)
 
         if not remote.is_dir():
             raise OSError(f"Source is not a directory: {remote}")
@@ -868,29 +1629,104 @@ class FirecrestTransport(Transport):
             # Destination directory does not exist, create and move content abc inside it
             local.mkdir(parents=True, exist_ok=False)
 
-        if self.payoff(remote):
+        use_tar, entries = self._remote_payoff(remote)
+        if use_tar:
             # in this case send a request to the server to tar the files and then download the tar file
             # unfortunately, the server does not provide a deferenced tar option, yet.
             self._gettreetar(remote, local, dereference=dereference)
         else:
-            # otherwise download the files one by one
-            for remote_item in remote.iterdir(recursive=True):
-                local_item = local.joinpath(remote_item.relpath(remote))
+            # otherwise download the files individually, several at a time.
+            # Directories are created while iterating, so they all exist before the downloads start.
+            downloads: list[tuple[FcPath, Path]] = []
+            # the listing made to decide is reused, rather than listing the tree again
+            if entries is None:
+                entries = self._list_files(str(remote), recursive=True)
+            remote_items = [
+                (entry["name"], _listed_path(remote, entry)) for entry in entries
+            ]
+            # symlinks pointing inside the tree are resolved from the listing, without a request
+            listed = {str(item): item for _, item in remote_items}
+            for relative_name, remote_item in remote_items:
+                local_item = local.joinpath(relative_name)
                 if dereference and remote_item.is_symlink():
-                    target_path = remote_item._cache.link_target
-                    if not Path(target_path).is_absolute():
-                        target_path = remote_item.parent.joinpath(target_path).resolve()
-
-                    target_path = self._cwd.joinpath(target_path)
-                    if target_path.is_dir():
+                    link_target = remote_item._cache.link_target
+                    if link_target is None:
+                        # not reported by the listing, so the server follows the link itself
+                        target_path = remote_item
+                    else:
+                        # link targets are POSIX paths, absolute if and only if they start with "/"
+                        if not link_target.startswith("/"):
+                            link_target = _normalize_path(
+                                posixpath.join(
+                                    posixpath.dirname(str(remote_item)), link_target
+                                )
+                            )
+                        listed_target = listed.get(link_target)
+                        if listed_target is not None and not listed_target.is_symlink():
+                            target_path = listed_target
+                        else:
+                            target_path = self._cwd.joinpath(link_target)
+                    target_is_dir = target_path.is_dir()
+                    if target_is_dir:
                         self.gettree(target_path, local_item, dereference=True)
                 else:
                     target_path = remote_item
+                    target_is_dir = remote_item.is_dir()
 
-                if not target_path.is_dir():
-                    self.getfile(target_path, local_item)
+                if not target_is_dir:
+                    downloads.append((target_path, local_item))
                 else:
                     local_item.mkdir(parents=True, exist_ok=True)
+            self._transfer_concurrently(self.getfile, downloads)
+
+    def _map_concurrently(
+        self, func: Callable[[Any], Any], items: list[Any]
+    ) -> list[Any]:
+        """Return `[func(item) for item in items]`, making up to `max_io_concurrency` calls at a time.
+
+        The calls are latency-bound (each is at least one HTTP request),
+        so running them in threads overlaps the round trips.
+        The first exception raised by a call is re-raised.
+        """
+        return list(self._imap_concurrently(func, items))
+
+    def _imap_concurrently(
+        self, func: Callable[[Any], Any], items: list[Any]
+    ) -> Iterator[Any]:
+        """Like `_map_concurrently`, but yield each result as soon as it is available
+        (in order, so once the results of all previous items have been yielded).
+
+        All threads share `self._client`. This is safe for the calls made here: the filesystem
+        and transfer methods of pyfirecrest keep their responses local to the call
+        (only the job submission/polling methods share `_current_method_requests`, and they are not
+        called from the threads), `requests.Session` draws connections from urllib3's thread-safe pool,
+        and a concurrent token refresh at worst fetches one token more than needed.
+
+        The calls enter `FcPath.convert_header_exceptions`, which saves and restores the process-wide
+        FirecREST logger level without any lock, so overlapping calls could leave logging muted.
+        Each call therefore runs inside a (thread-safe) `disable_fc_logging`, which keeps the level
+        muted while any call is running, and restores it once none is. Nothing is held across a `yield`,
+        so logging is not muted while the caller holds the generator (the pool itself is shut down
+        once the generator is exhausted or closed).
+        """
+        if self.max_io_concurrency <= 1 or len(items) <= 1:
+            yield from map(func, items)
+            return
+
+        def call(item: Any) -> Any:
+            with disable_fc_logging():
+                return func(item)
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_io_concurrency, len(items))
+        ) as executor:
+            yield from executor.map(call, items)
+
+    def _transfer_concurrently(
+        self, transfer: Callable[[Any, Any], None], pairs: list[tuple[Any, Any]]
+    ) -> None:
+        """Call `transfer(source, destination)` for each pair, see `_map_concurrently`."""
+        self._map_concurrently(lambda pair: transfer(*pair), pairs)
 
     def get(
         self,
@@ -915,10 +1751,13 @@ class FirecrestTransport(Transport):
             self.gettree(remote, localpath)
         elif remote.is_file():
             self.getfile(remote, localpath)
-        elif self.has_magic(str(remotepath)):  # type: ignore
-            for item in self.iglob(remotepath):  # type: ignore
+        elif self.has_magic(str(remotepath)):
+            # the types of all matches are checked before downloading, from the listings made by
+            # globbing, rather than with a listing of the parent directory for each match
+            items = list(self.iglob(remotepath))
+            for item, is_file in zip(items, self._isfile_many(items)):
                 # item is of str type, so we need to split it to get the file name
-                filename = item.split("/")[-1] if self.isfile(item) else ""
+                filename = item.split("/")[-1] if is_file else ""
                 self.get(
                     item,
                     localpath + filename,
@@ -929,6 +1768,7 @@ class FirecrestTransport(Transport):
         elif not ignore_nonexisting:
             raise FileNotFoundError(f"Source file does not exist: {remote}")
 
+    @_invalidates_glob_cache
     def putfile(
         self,
         localpath: str | Path,
@@ -964,12 +1804,24 @@ class FirecrestTransport(Transport):
             raise ValueError(f"Destination is a directory: {remote}")
 
         local_size = localpath.stat().st_size
+        local_hash: str | None = None
         # note this allows overwriting of existing files
         with self._cwd.convert_header_exceptions():
             if local_size < self._small_file_size_bytes:
-                self._client.simple_upload(
-                    self._machine, str(localpath), str(remote.parent), remote.name
-                )
+                with open(localpath, "rb", buffering=_TRANSFER_CHUNK_BYTES) as handle:
+                    # hash the file while it is uploaded, rather than reading it again afterwards
+                    source: IO[bytes] | _HashingReader = (
+                        _HashingReader(handle) if self.checksum_check else handle
+                    )
+                    # pyfirecrest only reads from file objects, although it annotates them as `BytesIO`
+                    self._client.simple_upload(
+                        self._machine,
+                        cast(BytesIO, source),
+                        str(remote.parent),
+                        remote.name,
+                    )
+                if isinstance(source, _HashingReader):
+                    local_hash = source.hexdigest()
             else:
                 # TODO the following is a very basic implementation of uploading a large file
                 # ideally though, if uploading multiple large files (i.e. in puttree),
@@ -986,7 +1838,7 @@ class FirecrestTransport(Transport):
                 up_obj.finish_upload()
 
         if self.checksum_check:
-            self._validate_checksum(localpath, str(remote))
+            self._validate_checksum(localpath, str(remote), local_hash=local_hash)
 
     def payoff(self, path: str | FcPath | Path) -> bool:
         """
@@ -997,21 +1849,62 @@ class FirecrestTransport(Transport):
         # It responses in 1, 1.5, 3, 5, 7 seconds!
         # So right now, I think if the number of files is more than 3, it pays off to tar everything
 
+        if isinstance(path, FcPath):
+            return self._remote_payoff(path)[0]
+        if isinstance(path, Path):
+            return self._local_payoff(path)[0]
         # If payoff_override is set, return its value
-        if self.payoff_override is not None:
-            return bool(self.payoff_override)
+        return bool(self.payoff_override)
+
+    def _remote_payoff(self, path: FcPath) -> tuple[bool, list[dict[str, Any]] | None]:
+        """Implementation of `payoff` for a remote directory.
 
-        return (
-            isinstance(path, FcPath)
-            and len(self.listdir(str(path), recursive=True)) > 3
-        ) or (isinstance(path, Path) and len(os.listdir(path)) > 3)
+        :return: whether to tar, and the recursive listing of the tree it was decided from
+            (None if `payoff_override` is set), so that `gettree` does not list the tree again.
+        """
+        if self.payoff_override is not None:
+            return bool(self.payoff_override), None
+        entries = self._list_files(str(path), recursive=True)
+        sizes = [
+            int(entry.get("size") or 0) for entry in entries if entry["type"] != "d"
+        ]
+        return self._payoff_sizes(sizes), entries
+
+    def _local_payoff(self, path: Path) -> tuple[bool, _Walk | None]:
+        """Implementation of `payoff` for a local directory.
+
+        :return: whether to tar, and the (symlink-following) `os.walk` of the tree it was decided from
+            (None if `payoff_override` is set), so that `puttree` does not walk the tree again.
+        """
+        if self.payoff_override is not None:
+            return bool(self.payoff_override), None
+        walk = list(os.walk(path, followlinks=True))
+        sizes = [
+            os.lstat(os.path.join(root, name)).st_size
+            for root, _, files in walk
+            for name in files
+        ]
+        return self._payoff_sizes(sizes), walk
+
+    def _payoff_sizes(self, sizes: list[int]) -> bool:
+        """Whether a tree holding files of the given sizes pays off to be transferred as a tar file.
+
+        A few large files gain little from being bundled, but cost the server a tar and an extraction,
+        so only tar when the files are also small on average.
+        Directories are not transferred as such, so they count neither towards the number nor the mean size,
+        and the whole tree is considered, so that the result does not depend on the order of the listing.
+        """
+        max_mean_size = self.payoff_size_threshold_mb * 1024 * 1024
+        return len(sizes) > 3 and sum(sizes) < max_mean_size * len(sizes)
 
+    @_invalidates_glob_cache
     def _puttreetar(
         self,
         localpath: str | Path,
         remotepath: str | FcPath,
         dereference: bool = True,
         *args: Any,
+        walk: _Walk | None = None,
         **kwargs: Any,
     ) -> None:
         """Put a directory to the remote by sending as tar file in backend.
@@ -1020,6 +1913,7 @@ class FirecrestTransport(Transport):
         Note that this method is not part of the Transport interface, and is not meant to be used publicly.
 
         :param dereference: If True, follow symlinks. If False, symlinks are ignored from sending over.
+        :param walk: the `os.walk` of `localpath` (following symlinks as `dereference`), if already made.
         """
         # this function will be used to send a folder as a tar file to the server and extract it on the server
 
@@ -1028,12 +1922,23 @@ class FirecrestTransport(Transport):
         localpath = Path(localpath)
         tarpath = localpath.parent.joinpath(f"temp_{_}.tar")
         remote_path_temp = self._temp_directory.joinpath(f"temp_{_}.tar")
-        with tarfile.open(tarpath, "w", dereference=dereference) as tar:
-            for root, _, files in os.walk(localpath, followlinks=dereference):
+        # stream the archive out sequentially, in large writes
+        with tarfile.open(
+            tarpath, "w|", bufsize=_TRANSFER_CHUNK_BYTES, dereference=dereference
+        ) as tar:
+            # copy member contents in chunks of the same size, rather than the 16 KiB default
+            tar.copybufsize = _TRANSFER_CHUNK_BYTES  # type: ignore[attr-defined]
+            if walk is None:
+                walk = list(os.walk(localpath, followlinks=dereference))
+            for root, _, files in walk:
+                relative_root = os.path.relpath(root, localpath)
                 for file in files:
-                    full_path = os.path.join(root, file)
-                    relative_path = os.path.relpath(full_path, localpath)
-                    tar.add(full_path, arcname=relative_path)
+                    relative_path = (
+                        file
+                        if relative_root == "."
+                        else os.path.join(relative_root, file)
+                    )
+                    tar.add(os.path.join(root, file), arcname=relative_path)
 
         # Upload
         try:
@@ -1045,7 +1950,7 @@ class FirecrestTransport(Transport):
         try:
             self._client.extract(self._machine, remote_path_temp, str(remotepath))
         finally:
-            self.remove(remote_path_temp)
+            self._remove_temp_file(remote_path_temp)
 
     def puttree(
         self,
@@ -1083,21 +1988,42 @@ class FirecrestTransport(Transport):
             # Destination directory does not exist, create and move content abc inside it
             self.mkdir(remote, ignore_existing=False)
 
-        if self.payoff(localpath):
+        # the walk made to decide is reused for the transfer, rather than walking the tree again
+        use_tar, walk = self._local_payoff(localpath)
+        if walk is None:
+            walk = list(os.walk(localpath, followlinks=dereference))
+        if use_tar:
             # in this case send send everything as a tar file
-            self._puttreetar(localpath, remote)
+            self._puttreetar(localpath, remote, walk=walk)
         else:
-            # otherwise send the files one by one
-            for dirpath, _, filenames in os.walk(localpath, followlinks=dereference):
+            # otherwise send the files individually, several at a time.
+            # Directories are all created before the uploads start.
+            uploads: list[tuple[str, FcPath]] = []
+            folders: list[str] = []
+            for dirpath, _, filenames in walk:
                 rel_folder = os.path.relpath(path=dirpath, start=localpath)
 
-                rm_parent_now = remote.joinpath(rel_folder)
-                self.mkdir(rm_parent_now, ignore_existing=True)
+                if rel_folder == ".":
+                    # the root has just been created above
+                    rm_parent_now = remote
+                else:
+                    rm_parent_now = remote.joinpath(rel_folder)
+                    folders.append(rel_folder)
 
-                for filename in filenames:
-                    localfile_path = os.path.join(localpath, rel_folder, filename)
-                    remotefile_path = rm_parent_now.joinpath(filename)
-                    self.putfile(localfile_path, remotefile_path)
+                uploads.extend(
+                    (os.path.join(dirpath, filename), rm_parent_now.joinpath(filename))
+                    for filename in filenames
+                )
+            # creating the deepest directories with their parents creates all of them,
+            # with one request per branch, rather than one per directory
+            parents = {os.path.dirname(folder) for folder in folders}
+            self._map_concurrently(
+                lambda folder: self.makedirs(
+                    str(remote.joinpath(folder)), ignore_existing=True
+                ),
+                [folder for folder in folders if folder not in parents],
+            )
+            self._transfer_concurrently(self.putfile, uploads)
 
     def put(
         self,
@@ -1125,10 +2051,11 @@ class FirecrestTransport(Transport):
         if not local.is_absolute():
             raise ValueError("The localpath must be an absolute path")
 
-        if self.has_magic(str(localpath)):  # type: ignore
-            for item in self.iglob(localpath):  # type: ignore
+        if self.has_magic(str(localpath)):
+            # the pattern is expanded on the local filesystem, which costs no requests
+            for item in glob.iglob(str(localpath)):
                 # item is of str type, so we need to split it to get the file name
-                filename = item.split("/")[-1] if self.isfile(item) else ""
+                filename = item.split("/")[-1] if os.path.isfile(item) else ""
                 self.put(
                     item,
                     remotepath + filename,
@@ -1137,7 +2064,7 @@ class FirecrestTransport(Transport):
                 )
             return
 
-        if not Path(local).exists() and not ignore_nonexisting:
+        if not local.exists() and not ignore_nonexisting:
             raise FileNotFoundError(f"Source file does not exist: {localpath}")
 
         if local.is_dir():
@@ -1145,31 +2072,65 @@ class FirecrestTransport(Transport):
         elif local.is_file():
             self.putfile(localpath, remotepath)
 
+    @_invalidates_glob_cache
     def remove(self, path: str | FcPath) -> None:
         """Remove a file or directory on the remote."""
-        self._cwd.joinpath(str(path)).unlink()
+        # the server deletes with `rm -rf`, so the type must be checked first,
+        # from a fresh listing of the parent, as a stale one could let a directory be deleted
+        ftype = self._entry_type(str(path), fetch=True, fresh=True)
+        path_abs = self._cwd.joinpath(str(path))
+        if ftype is None:
+            path_abs.unlink()
+            return
+        if not ftype:
+            raise FileNotFoundError(path_abs)
+        if ftype == "d":
+            raise IsADirectoryError(path_abs)
+        with path_abs.convert_header_exceptions():
+            self._client.simple_delete(self._machine, str(path_abs))
+
+    @_invalidates_glob_cache
+    def _remove_temp_file(self, path: FcPath) -> None:
+        """Remove a temporary file created by this transport.
+        Its type is known, so unlike `remove` this skips the check before deleting."""
+        with self._cwd.convert_header_exceptions():
+            self._client.simple_delete(self._machine, str(path))
 
+    @_invalidates_glob_cache
     def rename(self, oldpath: str, newpath: str) -> None:
         """Rename a file or directory on the remote."""
         self._cwd.joinpath(oldpath).rename(self._cwd.joinpath(newpath))
 
+    @_invalidates_glob_cache
     def rmdir(self, path: str) -> None:
         """Remove a directory on the remote.
         If the directory is not empty, an OSError is raised."""
-
-        if len(self.listdir(path)) == 0:
-            self._cwd.joinpath(path).rmtree()
-        else:
+        if self.listdir(path):
             raise OSError(f"Directory not empty: {path}")
+        # an empty listing can only come from a directory, so there is no need to check it again
+        with self._cwd.convert_header_exceptions():
+            self._client.simple_delete(self._machine, str(self._cwd.joinpath(path)))
 
+    @_invalidates_glob_cache
     def rmtree(self, path: str) -> None:
         """Remove a directory on the remote.
         If the directory is not empty, it will be removed recursively, equivalent to `rm -rf`.
         It does not raise an error if the directory does not exist.
         """
-        # TODO: suppress is to mimick the behaviour of `aiida-ssh`` transport, TODO: raise an issue on aiida
-        with suppress(FileNotFoundError):
-            self._cwd.joinpath(path).rmtree()
+        # as in `remove`, the type is checked from a fresh listing of the parent
+        ftype = self._entry_type(path, fetch=True, fresh=True)
+        path_abs = self._cwd.joinpath(path)
+        if ftype is None:
+            # TODO: suppress is to mimick the behaviour of `aiida-ssh`` transport, TODO: raise an issue on aiida
+            with suppress(FileNotFoundError):
+                path_abs.rmtree()
+            return
+        if not ftype:
+            return
+        if ftype != "d":
+            raise NotADirectoryError(path_abs)
+        with path_abs.convert_header_exceptions():
+            self._client.simple_delete(self._machine, str(path_abs))
 
     def whoami(self) -> str | None:
         """Return the username of the current user.
@@ -1,34 +1,47 @@
 from __future__ import annotations
 
-from collections.abc import Iterator
-from contextlib import contextmanager
+import threading
 from typing import Any, Callable
 
 from aiida.schedulers import SchedulerError
 from firecrest.BasicClient import logger as FcLogger  # noqa: N812
 from firecrest.FirecrestException import HeaderException
 
+_FC_LOGGING_LOCK = threading.Lock()
+_fc_logging_depth = 0
+_fc_logging_level = 0
 
-@contextmanager
-def disable_fc_logging() -> Iterator[None]:
+
+class disable_fc_logging:  # noqa: N801
     """Temporarily disable Firecrest logging.
 
     This is useful when calling methods that are expected to fail,
     such as `exists` or `is_dir`, as it avoids polluting the log with errors.
+
+    The logger level is process-wide, while the transport enters this from several threads at once,
+    so the nesting depth is counted under a lock: only the outermost entry saves the level,
+    and only the last exit restores it.
     """
-    level = FcLogger.level
-    FcLogger.setLevel(60)
-    try:
-        yield
-    finally:
-        FcLogger.setLevel(level)
-
-
-@contextmanager
-def convert_header_exceptions(
-    data: dict[str, Any],
-    updates: dict[str, Callable[[dict[str, Any]], Exception]] | None = None,
-) -> Iterator[None]:
+
+    __slots__ = ()
+
+    def __enter__(self) -> None:
+        global _fc_logging_depth, _fc_logging_level
+        with _FC_LOGGING_LOCK:
+            if _fc_logging_depth == 0:
+                _fc_logging_level = FcLogger.level
+                FcLogger.setLevel(60)
+            _fc_logging_depth += 1
+
+    def __exit__(self, *exc_info: Any) -> None:
+        global _fc_logging_depth
+        with _FC_LOGGING_LOCK:
+            _fc_logging_depth -= 1
+            if _fc_logging_depth == 0:
+                FcLogger.setLevel(_fc_logging_level)
+
+
+class convert_header_exceptions(disable_fc_logging):  # noqa: N801
     """Catch HeaderException and re-raise as an alternative.
 
     Default conversions are:
@@ -43,32 +56,32 @@ def convert_header_exceptions(
     - X-A-Directory: IsADirectoryError
     - X-Size-Limit: FileSizeExceeded
     - X-Sbatch-Error: SchedulerError
+    - X-Invalid-Mode: InvalidModeError
 
     """
-    converters: dict[str, Callable[[dict[str, Any]], Exception]] = {
-        "X-Timeout": ApiTimeoutError,
-        "X-Machine-Does-Not-Exist": MachineDoesNotExistError,
-        "X-Machine-Not-Available": PermissionError,
-        "X-Permission-Denied": PermissionError,
-        "X-Not-Found": FileNotFoundError,
-        "X-Not-A-Directory": NotADirectoryError,
-        "X-Exists": FileExistsError,
-        "X-Invalid-Path": FileNotFoundError,
-        "X-A-Directory": IsADirectoryError,
-        "X-Size-Limit": FileSizeExceededError,
-        "X-Sbatch-Error": SchedulerError,
-    }
-    if updates is not None:
-        converters.update(updates)
-    with disable_fc_logging():
-        try:
-            yield
-        except HeaderException as exc:
+
+    __slots__ = ("_data", "_converters")
+
+    def __init__(
+        self,
+        data: dict[str, Any],
+        updates: dict[str, Callable[[dict[str, Any]], Exception]] | None = None,
+    ) -> None:
+        self._data = data
+        # the default conversions are only copied if they are updated
+        self._converters = (
+            _DEFAULT_CONVERTERS
+            if updates is None
+            else {**_DEFAULT_CONVERTERS, **updates}
+        )
+
+    def __exit__(self, exc_type: Any, exc: BaseException | None, tb: Any) -> None:
+        super().__exit__(exc_type, exc, tb)
+        if isinstance(exc, HeaderException):
             for header in exc.responses[-1].headers:
-                c = converters.get(header)
+                c = self._converters.get(header)
                 if c is not None:
-                    raise c(data) from exc
-            raise
+                    raise c(self._data) from exc
 
 
 class ApiTimeoutError(TimeoutError):
@@ -96,3 +109,30 @@ class FileSizeExceededError(OSError):
         if "path" in data:
             msg += f": {data['path']}"
         super().__init__(msg)
+
+
+class InvalidModeError(ValueError):
+    """The file mode is not valid."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        msg = "Invalid mode"
+        if "mode" in data:
+            msg += f": {data['mode']}"
+        super().__init__(msg)
+
+
+_DEFAULT_CONVERTERS: dict[str, Callable[[dict[str, Any]], Exception]] = {
+    "X-Timeout": ApiTimeoutError,
+    "X-Machine-Does-Not-Exist": MachineDoesNotExistError,
+    "X-Machine-Not-Available": PermissionError,
+    "X-Permission-Denied": PermissionError,
+    "X-Not-Found": FileNotFoundError,
+    "X-Not-A-Directory": NotADirectoryError,
+    "X-Exists": FileExistsError,
+    "X-Invalid-Path": FileNotFoundError,
+    "X-A-Directory": IsADirectoryError,
+    "X-Size-Limit": FileSizeExceededError,
+    "X-Sbatch-Error": SchedulerError,
+    "X-Invalid-Mode": InvalidModeError,
+}
+"""The default conversions of `convert_header_exceptions`."""
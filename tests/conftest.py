@@ -198,7 +198,8 @@ class MockFirecrest:
                 else:
                     content_type = "NON"
                     link_target = None
-                permissions = stat.filemode(Path(full_path).lstat().st_mode)[1:]
+                lstat = Path(full_path).lstat()
+                permissions = stat.filemode(lstat.st_mode)[1:]
                 if name.startswith(".") and not show_hidden:
                     continue
                 content_list.append(
@@ -207,6 +208,7 @@ class MockFirecrest:
                         "type": content_type,
                         "link_target": link_target,
                         "permissions": permissions,
+                        "size": str(lstat.st_size),
                     }
                 )
 
@@ -238,6 +240,9 @@ class MockFirecrest:
         target = Path(target_path)
         target.mkdir(exist_ok=ignore_existing, parents=p)
 
+    def chmod(self, machine: str, target_path: str, mode: str):
+        os.chmod(target_path, int(mode, 8))
+
     def simple_delete(self, machine: str, target_path: str):
         if not Path(target_path).exists():
             raise FileNotFoundError(f"File or folder {target_path} does not exist")
@@ -258,7 +263,11 @@ class MockFirecrest:
             raise IsADirectoryError(f"{remote_path} is a directory")
         if not Path(remote_path).exists():
             raise FileNotFoundError(f"{remote_path} does not exist")
-        os.system(f"cp {remote_path} {local_path}")
+        if not isinstance(local_path, (str, Path)):
+            # pyfirecrest also accepts a writable binary stream
+            local_path.write(Path(remote_path).read_bytes())
+            return
+        shutil.copyfile(remote_path, local_path)
 
     def simple_upload(
         self,
@@ -270,13 +279,17 @@ class MockFirecrest:
         # this procedure is complecated in firecrest, but I am simplifying it here
         # we don't care about the details of the upload, we just want to make sure
         # that the aiida-firecrest code is calling the right functions at right time
+        if file_name:
+            remote_path = os.path.join(remote_path, file_name)
+        if not isinstance(local_path, (str, Path)):
+            # pyfirecrest also accepts a readable binary stream
+            Path(remote_path).write_bytes(local_path.read())
+            return
         if Path(local_path).is_dir():
             raise IsADirectoryError(f"{local_path} is a directory")
         if not Path(local_path).exists():
             raise FileNotFoundError(f"{local_path} does not exist")
-        if file_name:
-            remote_path = os.path.join(remote_path, file_name)
-        os.system(f"cp {local_path} {remote_path}")
+        shutil.copyfile(local_path, remote_path)
 
     def copy(self, machine: str, source_path: str, target_path: str):
         # this is how firecrest does it
@@ -299,7 +312,7 @@ class MockFirecrest:
         os.system(f"tar -xf '{source_path}' -C '{target_path}'")
 
     def checksum(self, machine: str, remote_path: str) -> int:
-        if not remote_path.exists():
+        if not os.path.exists(remote_path):
             return False
         # Firecrest uses sha256
         sha256_hash = hashlib.sha256()
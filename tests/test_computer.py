@@ -200,3 +200,18 @@ def test_dynamic_info_firecrest_version(
             f"FirecREST api version v{unsupported_version} is not supported"
             in capture.out
         )
+
+
+def test_transfer_chunk_bytes(monkeypatch):
+    from aiida_firecrest.transport import _transfer_chunk_bytes
+
+    monkeypatch.setenv("AIIDA_FIRECREST_CHUNK_MB", "4")
+    assert _transfer_chunk_bytes() == 4 * 1024 * 1024
+
+    # invalid values fall back to the default, tiny ones are clamped
+    for value in ("not a number", "nan", "inf"):
+        monkeypatch.setenv("AIIDA_FIRECREST_CHUNK_MB", value)
+        assert _transfer_chunk_bytes() == 1024 * 1024
+    for value in ("0", "-1", "0.0001"):
+        monkeypatch.setenv("AIIDA_FIRECREST_CHUNK_MB", value)
+        assert _transfer_chunk_bytes() == 64 * 1024
@@ -204,6 +204,21 @@ def test_remove(firecrest_computer: orm.Computer, tmpdir: Path):
     assert not _scratch.exists()
 
 
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_invalid_api_version(firecrest_computer: orm.Computer):
+    """The format of the api version is checked when the transport is constructed."""
+    transport = firecrest_computer.get_transport()
+    params = {
+        **firecrest_computer.get_authinfo(
+            orm.User.collection.get_default()
+        ).get_auth_params(),
+        "machine": firecrest_computer.hostname,
+        "api_version": "latest",
+    }
+    with pytest.raises(ValueError, match="Invalid FirecREST api version"):
+        type(transport)(**params)
+
+
 @pytest.mark.usefixtures("aiida_profile_clean")
 def test_is_file(firecrest_computer: orm.Computer, tmpdir: Path):
     transport = firecrest_computer.get_transport()
@@ -217,6 +232,14 @@ def test_is_file(firecrest_computer: orm.Computer, tmpdir: Path):
     assert transport.isfile(_remote / "samplefile")
     assert not transport.isfile(_remote / "does_not_exist")
 
+    # the checks are not answered from earlier listings, so changes made by others are seen at once
+    assert not transport.isfile(_remote / "external")
+    assert not transport.path_exists(_remote / "external")
+    Path(_remote / "external").touch()
+    assert transport.isfile(_remote / "external")
+    assert not transport.isdir(_remote / "external")
+    assert transport.path_exists(_remote / "external")
+
 
 @pytest.mark.usefixtures("aiida_profile_clean")
 def test_symlink(firecrest_computer: orm.Computer, tmpdir: Path):
@@ -287,6 +310,122 @@ def test_listdir(firecrest_computer: orm.Computer, tmpdir: Path):
     # see the open issue on FirecREST: https://github.com/eth-cscs/firecrest/issues/205
     assert set(transport.listdir(_remote / "dir2_link", recursive=False)) == {"file3"}
 
+    # literal patterns are checked with a single stat, rather than listing the directory
+    with patch.object(
+        transport, "_list_files", wraps=transport._list_files
+    ) as list_files:
+        assert transport.listdir(_remote, pattern="file1") == ["file1"]
+        assert transport.listdir(_remote, pattern=".hidden") == [".hidden"]
+        list_files.assert_not_called()
+    assert transport.listdir(_remote, pattern="missing") == []
+    assert sorted(transport.listdir(_remote, pattern="file*")) == ["file1", "file_link"]
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_listdir_withattributes(firecrest_computer: orm.Computer, tmpdir: Path):
+    transport = firecrest_computer.get_transport()
+    _remote = transport._temp_directory
+    _local = tmpdir
+
+    Path(_local / "file1").write_text("file1")
+    Path(_local / "file2.txt").write_text("file2.txt")
+    transport.putfile(_local / "file1", _remote / "file1")
+    transport.putfile(_local / "file2.txt", _remote / "file2.txt")
+    transport.mkdir(_remote / "dir1")
+
+    result = {item["name"]: item for item in transport.listdir_withattributes(_remote)}
+    assert set(result) == {"file1", "file2.txt", "dir1"}
+    assert result["dir1"]["isdir"]
+    assert not result["file1"]["isdir"]
+    assert result["file1"]["attributes"].st_size == len("file1")
+
+    # filter with a pattern
+    result = transport.listdir_withattributes(_remote, pattern="*.txt")
+    assert [item["name"] for item in result] == ["file2.txt"]
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_glob(firecrest_computer: orm.Computer, tmpdir: Path):
+    transport = firecrest_computer.get_transport()
+    _remote = str(transport._temp_directory)
+
+    Path(tmpdir / "file").touch()
+    for directory in ("dir1", "dir2", "other"):
+        transport.mkdir(f"{_remote}/{directory}")
+        transport.putfile(tmpdir / "file", f"{_remote}/{directory}/file.txt")
+        transport.putfile(tmpdir / "file", f"{_remote}/{directory}/file.dat")
+    transport.putfile(tmpdir / "file", f"{_remote}/dir1/.hidden.txt")
+    transport.putfile(tmpdir / "file", f"{_remote}/top.txt")
+    transport.symlink(f"{_remote}/top.txt", f"{_remote}/link")
+    transport.mkdir(f"{_remote}/dir2/sub")
+    transport.putfile(tmpdir / "file", f"{_remote}/dir2/sub/file.txt")
+
+    # magic in both the directory and the basename
+    assert sorted(transport.glob(f"{_remote}/dir*/*.txt")) == [
+        f"{_remote}/dir1/file.txt",
+        f"{_remote}/dir2/file.txt",
+    ]
+    # magic in the directory only
+    assert sorted(transport.glob(f"{_remote}/*/file.dat")) == [
+        f"{_remote}/dir1/file.dat",
+        f"{_remote}/dir2/file.dat",
+        f"{_remote}/other/file.dat",
+    ]
+    # files (and symlinks to files) matched by the directory part are not globbed into
+    assert sorted(transport.glob(f"{_remote}/*/*.txt")) == [
+        f"{_remote}/dir1/file.txt",
+        f"{_remote}/dir2/file.txt",
+        f"{_remote}/other/file.txt",
+    ]
+    # literal components after the magic one
+    assert transport.glob(f"{_remote}/*/sub/file.txt") == [
+        f"{_remote}/dir2/sub/file.txt"
+    ]
+    # hidden files are only matched explicitly
+    assert transport.glob(f"{_remote}/dir1/.*.txt") == [f"{_remote}/dir1/.hidden.txt"]
+    # no magic at all
+    assert transport.glob(f"{_remote}/other/file.txt") == [f"{_remote}/other/file.txt"]
+    assert transport.glob(f"{_remote}/other/missing") == []
+
+    # listings are reused, until the transport modifies the remote
+    with patch.object(
+        transport, "_list_files", wraps=transport._list_files
+    ) as list_files:
+        assert transport.glob(f"{_remote}/dir1/*.dat") == [f"{_remote}/dir1/file.dat"]
+        list_files.assert_not_called()
+        transport.putfile(tmpdir / "file", f"{_remote}/dir1/file2.dat")
+        assert sorted(transport.glob(f"{_remote}/dir1/*.dat")) == [
+            f"{_remote}/dir1/file.dat",
+            f"{_remote}/dir1/file2.dat",
+        ]
+        list_files.assert_called_once()
+
+    # literal basenames are looked up in recent listings of their directory
+    transport.glob(f"{_remote}/dir*/*")
+    with patch.object(
+        transport, "path_exists", wraps=transport.path_exists
+    ) as path_exists:
+        assert sorted(transport.glob(f"{_remote}/dir*/file.dat")) == [
+            f"{_remote}/dir1/file.dat",
+            f"{_remote}/dir2/file.dat",
+        ]
+        assert transport.glob(f"{_remote}/dir*/missing") == []
+        path_exists.assert_not_called()
+
+    # several patterns in the same directory
+    result = transport.glob_many(f"{_remote}/dir1", ["*.txt", ".*", "*.dat", "x*"])
+    assert {pattern: sorted(names) for pattern, names in result.items()} == {
+        "*.txt": ["file.txt"],
+        ".*": [".hidden.txt"],
+        "*.dat": ["file.dat", "file2.dat"],
+        "x*": [],
+    }
+
+    # the types of several matches are read from the listings of their directories
+    assert transport._isfile_many(
+        [f"{_remote}/top.txt", f"{_remote}/link", f"{_remote}/dir1", f"{_remote}/nope"]
+    ) == [True, True, False, False]
+
 
 @pytest.mark.usefixtures("aiida_profile_clean")
 def test_put(firecrest_computer: orm.Computer, tmpdir: Path):
@@ -324,6 +463,14 @@ def test_put(firecrest_computer: orm.Computer, tmpdir: Path):
         transport.put(_local / "file1_link", _remote / "file1_link")
     mock_putfile.assert_called_once()
 
+    # glob patterns are expanded on the local filesystem
+    with patch.object(transport, "putfile", autospec=True) as mock_putfile:
+        transport.put(f"{_local}/file1*", f"{_remote}/")
+    assert sorted(call.args[1] for call in mock_putfile.call_args_list) == [
+        f"{_remote}/file1",
+        f"{_remote}/file1_link",
+    ]
+
     # raise if local file/folder does not exist
     with pytest.raises(FileNotFoundError):
         transport.put(_local / "does_not_exist", _remote)
@@ -741,6 +888,19 @@ def test_copy(firecrest_computer: orm.Computer, tmpdir: Path, to_test: str):
 
     # End of ASSERT block
 
+    # every match of a glob pattern is copied
+    if to_test == "copy":
+        _remote_3 = tmpdir_remote / "remotedir_3"
+        _remote_3.mkdir()
+        testing(f"{_remote_1}/dir*", f"{_remote_3}/")
+        testing(f"{_remote_1}/*1", f"{_remote_3}/")
+        assert sorted(transport.listdir(_remote_3)) == ["dir1", "dir2", "file1"]
+        assert sorted(transport.listdir(_remote_3 / "dir1")) == [
+            "dir2_link",
+            "file1_link",
+            "file2",
+        ]
+
     # raise if source is inappropriate
     if to_test == "copytree":
         with pytest.raises(ValueError):
@@ -787,8 +947,12 @@ def test_copyfile(firecrest_computer: orm.Computer, tmpdir: Path):
     transport.putfile(_for_upload / "notfile1", _remote_1 / "notfile1")
     transport.symlink(_remote_1 / "file1", _remote_1 / "file1_link")
 
-    # write where I tell you to
-    testing(_remote_1 / "file1", _remote_2 / "file1")
+    # write where I tell you to, checking the source with a single listing
+    with patch.object(
+        transport, "_list_files", wraps=transport._list_files
+    ) as list_files:
+        testing(_remote_1 / "file1", _remote_2 / "file1")
+        assert list_files.call_count == 1
     transport.getfile(_remote_2 / "file1", _for_download / "file1")
     assert Path(_for_download / "file1").read_text() == "file1"
 
@@ -807,3 +971,240 @@ def test_copyfile(firecrest_computer: orm.Computer, tmpdir: Path):
     assert transport._cwd.joinpath(_remote_2 / "file1_link").is_symlink()
     transport.getfile(_remote_2 / "file1_link", _for_download / "file1_link")
     assert Path(_for_download / "file1_link").read_text() == "file1"
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_validate_checksum(firecrest_computer: orm.Computer, tmpdir: Path):
+    transport = firecrest_computer.get_transport()
+    _remote = transport._temp_directory
+    _local = tmpdir
+
+    Path(_local / "file1").write_text("file1")
+    Path(_local / "file2").write_text("file2")
+    transport.putfile(_local / "file1", _remote / "file1")
+
+    # should pass silently if the checksums match
+    transport._validate_checksum(_local / "file1", _remote / "file1")
+
+    # raise if the checksums do not match
+    with pytest.raises(ValueError):
+        transport._validate_checksum(_local / "file2", _remote / "file1")
+
+    # the hash computed while downloading is validated against the remote one
+    transport.checksum_check = True
+    transport.getfile(_remote / "file1", _local / "file1_download")
+    assert Path(_local / "file1_download").read_text() == "file1"
+
+    # and so is the hash computed while uploading
+    transport.putfile(_local / "file2", _remote / "file2")
+    assert Path(_remote / "file2").read_text() == "file2"
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_shared_client(firecrest_computer: orm.Computer):
+    from aiida_firecrest.transport import close_clients
+
+    # transports with the same credentials share a single client
+    transport_1 = firecrest_computer.get_transport()
+    transport_2 = firecrest_computer.get_transport()
+    assert transport_1._client is transport_2._client
+
+    # a new client is created once the shared ones are dropped
+    close_clients()
+    transport_3 = firecrest_computer.get_transport()
+    assert transport_3._client is not transport_1._client
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_disable_fc_logging_threads(firecrest_computer: orm.Computer):
+    from concurrent.futures import ThreadPoolExecutor
+    import time
+
+    from aiida_firecrest.utils import FcLogger, disable_fc_logging
+
+    level = FcLogger.level
+
+    def muted(_):
+        with disable_fc_logging():
+            assert FcLogger.level == 60
+            time.sleep(0.001)
+
+    # overlapping entries from several threads restore the original level once all have exited
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(muted, range(64)))
+    assert FcLogger.level == level
+
+    # so do the threads of the transport, which go through pyfirecrest's own (unlocked) suppression
+    transport = firecrest_computer.get_transport()
+    transport.glob_cache_ttl = 0
+    _remote = str(transport._temp_directory)
+    transport._map_concurrently(transport.isdir, [_remote] * 64)
+    assert FcLogger.level == level
+
+    # and logging is not muted while a concurrent `iglob` is suspended
+    for name in ("dir1", "dir2", "dir3"):
+        transport.mkdir(f"{_remote}/{name}")
+        transport.write_binary(f"{_remote}/{name}/file", b"")
+    matches = transport.iglob(f"{_remote}/dir*/file")
+    assert next(matches).endswith("/file")
+    # (once the calls still in flight have finished)
+    deadline = time.monotonic() + 5
+    while FcLogger.level != level and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert FcLogger.level == level
+    matches.close()
+    assert FcLogger.level == level
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_chmod(firecrest_computer: orm.Computer, tmpdir: Path):
+    transport = firecrest_computer.get_transport()
+    _remote = transport._temp_directory
+
+    Path(tmpdir / "file1").touch()
+    transport.putfile(tmpdir / "file1", _remote / "file1")
+
+    # the mode can be given as an integer or as an octal string
+    transport.chmod(_remote / "file1", 0o700)
+    assert transport.get_attribute(_remote / "file1").st_mode & 0o777 == 0o700
+    transport.chmod(_remote / "file1", "644")
+    assert transport.get_attribute(_remote / "file1").st_mode & 0o777 == 0o644
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_payoff(firecrest_computer: orm.Computer, tmpdir: Path):
+    transport = firecrest_computer.get_transport()
+    transport._payoff_override = None
+    _remote = transport._temp_directory
+    _local = Path(tmpdir)
+
+    # files in nested directories count towards the threshold, directories do not
+    transport.mkdir(_remote / "dir1")
+    transport.mkdir(_remote / "dir1" / "dir2")
+    Path(tmpdir / "file1").touch()
+    transport.putfile(tmpdir / "file1", _remote / "dir1" / "file1")
+    transport.putfile(tmpdir / "file1", _remote / "dir1" / "dir2" / "file1")
+    transport.putfile(tmpdir / "file1", _remote / "dir1" / "dir2" / "file2")
+    assert not transport.payoff(transport._cwd.joinpath(_remote / "dir1"))
+    transport.putfile(tmpdir / "file1", _remote / "dir1" / "dir2" / "file3")
+    assert transport.payoff(transport._cwd.joinpath(_remote / "dir1"))
+
+    _local.joinpath("local", "sub").mkdir(parents=True)
+    for name in ("file1", "file2"):
+        _local.joinpath("local", name).touch()
+    _local.joinpath("local", "sub", "file3").touch()
+    assert not transport.payoff(_local / "local")
+    _local.joinpath("local", "sub", "file4").touch()
+    assert transport.payoff(_local / "local")
+
+    # a few large files are not worth a tar, wherever they are in the listing
+    transport.payoff_size_threshold_mb = 1 / 1024
+    Path(tmpdir / "large").write_bytes(b"0" * 8 * 1024)
+    transport.mkdir(_remote / "dir1" / "dir2" / "dir3")
+    transport.putfile(tmpdir / "large", _remote / "dir1" / "dir2" / "dir3" / "large")
+    assert not transport.payoff(transport._cwd.joinpath(_remote / "dir1"))
+    _local.joinpath("local", "sub", "deeper").mkdir()
+    _local.joinpath("local", "sub", "deeper", "large").write_bytes(b"0" * 8 * 1024)
+    assert not transport.payoff(_local / "local")
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_tree_scanned_once(firecrest_computer: orm.Computer, tmpdir: Path):
+    """The scan made by `payoff` is reused for the transfer, rather than scanning the tree again."""
+    transport = firecrest_computer.get_transport()
+    transport._payoff_override = None
+    _remote = transport._temp_directory
+    _local = Path(tmpdir / "local")
+    _local.joinpath("sub").mkdir(parents=True)
+    _local.joinpath("file1").write_text("file1")
+    _local.joinpath("sub", "file2").write_text("file2")
+
+    with patch("os.walk", wraps=os.walk) as walk:
+        transport.puttree(_local, _remote / "remotedir")
+        # (`os.walk` may call itself for the subdirectories)
+        assert [call.args[0] for call in walk.call_args_list].count(_local) == 1
+
+    with patch.object(
+        transport, "_list_files", wraps=transport._list_files
+    ) as list_files:
+        transport.gettree(_remote / "remotedir", tmpdir / "downloaded")
+        assert list_files.call_count == 1
+    assert Path(tmpdir / "downloaded" / "sub" / "file2").read_text() == "file2"
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_gettree_tar_read_only(firecrest_computer: orm.Computer, tmpdir: Path):
+    """The tar mode of `gettree` must fill read-only directories before making them read-only."""
+    transport = firecrest_computer.get_transport()
+    transport.payoff_override = True
+    _remote = transport._temp_directory / "remotedir"
+    _remote.joinpath("readonly").mkdir(parents=True)
+    Path(tmpdir / "file1").write_text("file1")
+    transport.putfile(tmpdir / "file1", _remote / "readonly" / "file1")
+    transport.chmod(_remote / "readonly", 0o555)
+
+    _local = Path(tmpdir / "local")
+    try:
+        transport.gettree(_remote, _local)
+        assert Path(_local / "readonly" / "file1").read_text() == "file1"
+        assert Path(_local / "readonly").stat().st_mode & 0o777 == 0o555
+    finally:
+        transport.chmod(_remote / "readonly", 0o755)
+        if _local.joinpath("readonly").exists():
+            _local.joinpath("readonly").chmod(0o755)
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_gettree_tar_symlinks(firecrest_computer: orm.Computer, tmpdir: Path):
+    """The tar mode of `gettree` keeps symlinks that point outside of the tree, as `tar -xf` does."""
+    transport = firecrest_computer.get_transport()
+    transport.payoff_override = True
+    _remote = transport._temp_directory / "remotedir"
+    _remote.mkdir()
+    Path(tmpdir / "file1").write_text("file1")
+    transport.putfile(tmpdir / "file1", _remote / "file1")
+    # the mocked remote is on the local filesystem, so the (relative) links are created directly
+    os.symlink("/etc/hostname", str(_remote / "absolute_link"))
+    os.symlink("../outside", str(_remote / "relative_link"))
+
+    _local = Path(tmpdir / "local")
+    transport.gettree(_remote, _local, dereference=False)
+    assert Path(_local / "file1").read_text() == "file1"
+    assert os.readlink(_local / "absolute_link") == "/etc/hostname"
+    assert os.readlink(_local / "relative_link") == "../outside"
+
+
+def test_strip_tar_root_without_filter(tmpdir: Path):
+    """Without extraction filters, members outside of the destination are refused."""
+    import io
+    import tarfile
+
+    from aiida_firecrest.transport import _strip_tar_root
+
+    archive = Path(tmpdir / "archive.tar")
+    with tarfile.open(archive, "w") as tar:
+        for name in ("remotedir/file1", "remotedir/../../escaped"):
+            info = tarfile.TarInfo(name)
+            tar.addfile(info, io.BytesIO())
+
+    tar = tarfile.open(archive)
+    with patch("aiida_firecrest.transport._TAR_EXTRACT_KWARGS", {}), tar:
+        members = _strip_tar_root(tar)
+        assert next(members).name == "file1"
+        with pytest.raises(tarfile.ExtractError):
+            next(members)
+
+
+@pytest.mark.usefixtures("aiida_profile_clean")
+def test_gettree_tar_special_characters(firecrest_computer: orm.Computer, tmpdir: Path):
+    """The tar mode of `gettree` must cope with quotes and spaces in the local path."""
+    transport = firecrest_computer.get_transport()
+    transport.payoff_override = True
+    _remote = transport._temp_directory / "remotedir"
+    _remote.mkdir()
+    Path(tmpdir / "file1").write_text("file1")
+    transport.putfile(tmpdir / "file1", _remote / "file1")
+
+    _local = Path(tmpdir / "local dir with 'quotes'; and spaces")
+    transport.gettree(_remote, _local)
+    assert Path(_local / "file1").read_text() == "file1"